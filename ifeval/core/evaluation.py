@@ -410,26 +410,25 @@ class Evaluator:
             n = len(resp_list)
             c_strict: List[int] = [0] * len(inp.instruction_id_list)
             c_loose: List[int] = [0] * len(inp.instruction_id_list)
+            # Responses following all instructions, counted from the same
+            # evaluations as the per-instruction counts.
+            all_strict = all_loose = 0
             for r in resp_list:
                 out_s = self.test_instruction_following_strict(inp, r)
+                if out_s.follow_all_instructions:
+                    all_strict += 1
                 for idx, ok in enumerate(out_s.follow_instruction_list):
                     if ok:
                         c_strict[idx] += 1
                 out_l = self.test_instruction_following_loose(inp, r)
+                if out_l.follow_all_instructions:
+                    all_loose += 1
                 for idx, ok in enumerate(out_l.follow_instruction_list):
                     if ok:
                         c_loose[idx] += 1
             # Compute pass@k scores per prompt
-            pass_strict = pass_at_k(
-                n,
-                sum(1 for r in resp_list if self.test_instruction_following_strict(inp, r).follow_all_instructions),
-                k,
-            )
-            pass_loose = pass_at_k(
-                n,
-                sum(1 for r in resp_list if self.test_instruction_following_loose(inp, r).follow_all_instructions),
-                k,
-            )
+            pass_strict = pass_at_k(n, all_strict, k)
+            pass_loose = pass_at_k(n, all_loose, k)
 
             outputs.append(
                 PassAtKExample(
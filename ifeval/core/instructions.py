@@ -1,11 +1,75 @@
 """Base instruction classes and interfaces."""
 
+import functools
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Sequence, Union, Any
+from typing import Dict, List, Optional, Sequence, Union, Any
+
+
+def _freeze(value: Any) -> Any:
+    """Convert constructor arguments into a hashable cache key."""
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((key, _freeze(item)) for key, item in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(item) for item in value))
+    return (type(value), value)
+
+
+class _InstructionKwargs:
+    """Constructor kwargs that hash and compare by their frozen value."""
+
+    __slots__ = ("kwargs", "_key", "_hash")
+
+    def __init__(self, kwargs: Dict[str, Any]):
+        self.kwargs = kwargs
+        self._key = _freeze(kwargs)
+        self._hash = hash(self._key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _InstructionKwargs) and self._key == other._key
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_or_create(cls: type, kwargs: _InstructionKwargs) -> "BaseInstruction":
+    return cls(**kwargs.kwargs)
 
 
 class BaseInstruction(ABC):
-    """Base class for all instruction checking classes."""
+    """Base class for all instruction checking classes.
+    
+    `InstructionRegistry.create_instruction` shares one instance between all
+    calls with equal arguments, so an instruction must treat its attributes
+    as read-only after `__init__`: `check_following` must not store or
+    mutate state, or one response's check would leak into the next.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def get_or_create(cls, **kwargs) -> "BaseInstruction":
+        """Return a shared instance of this instruction for the given arguments.
+        
+        Instructions do not change state while checking responses, so
+        instances built from equal arguments are interchangeable and any
+        state prepared in `__init__` (compiled patterns, etc.) is reused.
+        Arguments that cannot be hashed fall back to a fresh instance.
+        
+        Args:
+            **kwargs: Parameters to pass to the instruction constructor.
+            
+        Returns:
+            An instance of the instruction class.
+        """
+        try:
+            key = _InstructionKwargs(kwargs)
+        except TypeError:
+            return cls(**kwargs)
+        return _get_or_create(cls, key)
+
     @abstractmethod
     def check_following(self, value: str) -> bool:
         """Check if a response follows this instruction.
@@ -16,4 +80,19 @@ class BaseInstruction(ABC):
         Returns:
             True if the instruction is followed, False otherwise.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def check_batch(self, values: Sequence[str]) -> List[bool]:
+        """Check a batch of responses against this instruction.
+        
+        Subclasses may override this when a batch can be checked more
+        efficiently than one response at a time.
+        
+        Args:
+            values: A sequence of response strings to check.
+            
+        Returns:
+            A list with the result of `check_following` for each response.
+        """
+        check_following = self.check_following
+        return [check_following(value) for value in values]
@@ -42,9 +42,10 @@ class InstructionRegistry:
         Raises:
             ValueError: If the instruction ID is not registered.
         """
-        if instruction_id not in self._instructions:
+        instruction_cls = self._instructions.get(instruction_id)
+        if instruction_cls is None:
             raise ValueError(f"Unknown instruction ID: {instruction_id}")
-        return self._instructions[instruction_id]
+        return instruction_cls
         
     def create_instruction(self, instruction_id: str, **kwargs) -> BaseInstruction:
         """Create an instruction instance by ID with given parameters.
@@ -54,13 +55,11 @@ class InstructionRegistry:
             **kwargs: Parameters to pass to the instruction constructor.
             
         Returns:
-            An instance of the instruction class.
+            An instance of the instruction class. Instances are shared between
+            calls with equal parameters.
             
         Raises:
             ValueError: If the instruction ID is not registered.
         """
-        if instruction_id not in self._instructions:
-            raise ValueError(f"Unknown instruction ID: {instruction_id}")
-        
-        instruction_cls = self._instructions[instruction_id]
-        return instruction_cls(**kwargs)
\ No newline at end of file
+        instruction_cls = self.get_instruction(instruction_id)
+        return instruction_cls.get_or_create(**kwargs)
\ No newline at end of file
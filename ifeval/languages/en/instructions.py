@@ -2,6 +2,7 @@
 
 import collections
 import json
+import operator
 import random
 import re
 import string
@@ -35,8 +36,10 @@ from ifeval.languages.generic import (
     RepeatPromptThenAnswer,
     EndChecker,
     LetterFrequencyChecker,
-    ResponseLanguageChecker
+    ResponseLanguageChecker,
+    REGEX_METACHARACTERS,
 )
+from ifeval.utils.text_processing import detect_language
 
 # Create registry and processor instances
 instruction_registry = InstructionRegistry()
@@ -54,6 +57,30 @@ _STARTEND = "startend:"
 _CHANGE_CASES = "change_case:"
 _PUNCTUATION = "punctuation:"
 
+# Comparison used by each relation in COMPARISON_RELATION.
+_COMPARISON_OPERATORS = {
+    COMPARISON_RELATION[0]: operator.lt,  # less than
+    COMPARISON_RELATION[1]: operator.ge,  # at least
+}
+
+# Leading part of a word up to the first punctuation mark.
+_WORD_BEFORE_PUNCTUATION_RE = re.compile(r"[^.,?!'\"]*")
+
+# Matches any of the constrained response options in a single scan.
+_CONSTRAINED_RESPONSE_RE = re.compile(
+    "|".join(re.escape(option) for option in CONSTRAINED_RESPONSE_OPTIONS)
+)
+
+
+def _is_ascii_literal(pattern):
+    """Whether a keyword pattern is plain ASCII text without regex syntax.
+
+    Case-insensitive search for such a pattern in an ASCII response is the
+    same as a substring test on the lowercased response.
+    """
+    return pattern.isascii() and REGEX_METACHARACTERS.isdisjoint(pattern)
+
+
 # Register generic instructions
 instruction_registry.register(_CONTENT + "number_placeholders")(PlaceholderChecker)
 instruction_registry.register(_FORMAT + "number_bullet_lists")(BulletListChecker)
@@ -81,6 +108,12 @@ class NumberOfSentences(BaseInstruction):
     "Your response should contain {relation} {num_sentences} sentences."
     """
 
+    __slots__ = (
+        "_num_sentences_threshold",
+        "_comparison_relation",
+        "_compare",
+    )
+
     def __init__(self, num_sentences, relation):
         """Initialize the sentence number checker.
         
@@ -100,6 +133,7 @@ class NumberOfSentences(BaseInstruction):
             )
         
         self._comparison_relation = relation
+        self._compare = _COMPARISON_OPERATORS[relation]
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -122,10 +156,7 @@ class NumberOfSentences(BaseInstruction):
             True if the response follows the instruction.
         """
         num_sentences = processor.count_sentences(value)
-        if self._comparison_relation == COMPARISON_RELATION[0]:  # less than
-            return num_sentences < self._num_sentences_threshold
-        elif self._comparison_relation == COMPARISON_RELATION[1]:  # at least
-            return num_sentences >= self._num_sentences_threshold
+        return self._compare(num_sentences, self._num_sentences_threshold)
 
 
 @instruction_registry.register(_FORMAT + "constrained_response")
@@ -136,10 +167,11 @@ class ConstrainedResponseChecker(BaseInstruction):
     "Answer with one of the following options: {response_options}"
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the constrained response checker."""
-        # A sequence of string(s) representing the options of the expected response.
-        self._constrained_responses = CONSTRAINED_RESPONSE_OPTIONS
+        pass
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -158,11 +190,7 @@ class ConstrainedResponseChecker(BaseInstruction):
         Returns:
             True if the actual response contains one of the options.
         """
-        value = value.strip()
-        for constrained_response in self._constrained_responses:
-            if constrained_response in value:
-                return True
-        return False
+        return _CONSTRAINED_RESPONSE_RE.search(value) is not None
 
 
 @instruction_registry.register(_KEYWORD + "existence")
@@ -173,6 +201,13 @@ class KeywordChecker(BaseInstruction):
     "Include keywords {keywords} in the response."
     """
 
+    __slots__ = (
+        "_keywords",
+        "_keyword_res",
+        "_literal_keywords",
+        "_pattern_res",
+    )
+
     def __init__(self, keywords):
         """Initialize the keyword checker.
         
@@ -181,6 +216,17 @@ class KeywordChecker(BaseInstruction):
                 expected in the response.
         """
         self._keywords = sorted(keywords)
+        self._keyword_res = [
+            re.compile(keyword, flags=re.IGNORECASE) for keyword in self._keywords
+        ]
+        self._literal_keywords = [
+            keyword.lower() for keyword in self._keywords if _is_ascii_literal(keyword)
+        ]
+        self._pattern_res = [
+            keyword_re
+            for keyword, keyword_re in zip(self._keywords, self._keyword_res)
+            if not _is_ascii_literal(keyword)
+        ]
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -192,8 +238,15 @@ class KeywordChecker(BaseInstruction):
 
     def check_following(self, value):
         """Check if the response contain the expected keywords."""
-        for keyword in self._keywords:
-            if not re.search(keyword, value, flags=re.IGNORECASE):
+        keyword_res = self._keyword_res
+        if value.isascii():
+            lowered = value.lower()
+            for keyword in self._literal_keywords:
+                if keyword not in lowered:
+                    return False
+            keyword_res = self._pattern_res
+        for keyword_re in keyword_res:
+            if not keyword_re.search(value):
                 return False
         return True
 
@@ -207,6 +260,15 @@ class KeywordFrequencyChecker(BaseInstruction):
     {frequency} times."
     """
 
+    __slots__ = (
+        "_keyword",
+        "_keyword_re",
+        "_literal_keyword",
+        "_frequency",
+        "_comparison_relation",
+        "_compare",
+    )
+
     def __init__(self, keyword, frequency, relation):
         """Initialize the keyword frequency checker.
         
@@ -218,6 +280,10 @@ class KeywordFrequencyChecker(BaseInstruction):
                 operator for comparison.
         """
         self._keyword = keyword.strip()
+        self._keyword_re = re.compile(self._keyword, flags=re.IGNORECASE)
+        self._literal_keyword = (
+            self._keyword.lower() if _is_ascii_literal(self._keyword) else None
+        )
         self._frequency = frequency
 
         if relation not in COMPARISON_RELATION:
@@ -227,6 +293,7 @@ class KeywordFrequencyChecker(BaseInstruction):
             )
         
         self._comparison_relation = relation
+        self._compare = _COMPARISON_OPERATORS[relation]
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -242,14 +309,18 @@ class KeywordFrequencyChecker(BaseInstruction):
 
     def check_following(self, value):
         """Checks if the response contain the keyword with required frequency."""
-        actual_occurrences = len(
-            re.findall(self._keyword, value, flags=re.IGNORECASE)
-        )
+        if self._literal_keyword is not None and value.isascii():
+            actual_occurrences = value.lower().count(self._literal_keyword)
+        else:
+            # Both relations are decided once the count reaches the threshold,
+            # so there is no need to scan past it.
+            actual_occurrences = 0
+            for _ in self._keyword_re.finditer(value):
+                actual_occurrences += 1
+                if actual_occurrences >= self._frequency:
+                    break
 
-        if self._comparison_relation == COMPARISON_RELATION[0]:  # less than
-            return actual_occurrences < self._frequency
-        elif self._comparison_relation == COMPARISON_RELATION[1]:  # at least
-            return actual_occurrences >= self._frequency
+        return self._compare(actual_occurrences, self._frequency)
 
 
 @instruction_registry.register(_LENGTH + "number_words")
@@ -260,6 +331,8 @@ class NumberOfWords(BaseInstruction):
     "Answer with {relation} {num_words} words."
     """
 
+    __slots__ = ("_num_words", "_comparison_relation", "_compare")
+
     def __init__(self, num_words, relation):
         """Initialize the word count checker.
         
@@ -278,6 +351,7 @@ class NumberOfWords(BaseInstruction):
             )
         
         self._comparison_relation = relation
+        self._compare = _COMPARISON_OPERATORS[relation]
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -291,10 +365,7 @@ class NumberOfWords(BaseInstruction):
         """Checks if the response contains the expected number of words."""
         num_words = processor.count_words(value)
 
-        if self._comparison_relation == COMPARISON_RELATION[0]:  # less than
-            return num_words < self._num_words
-        elif self._comparison_relation == COMPARISON_RELATION[1]:  # at least
-            return num_words >= self._num_words
+        return self._compare(num_words, self._num_words)
 
 
 @instruction_registry.register(_LENGTH + "nth_paragraph_first_word")
@@ -308,6 +379,8 @@ class ParagraphFirstWordCheck(BaseInstruction):
     Paragraph {nth_paragraph} must start with word {first_word}."
     """
 
+    __slots__ = ("_num_paragraphs", "_nth_paragraph", "_first_word")
+
     def __init__(self, num_paragraphs, nth_paragraph, first_word):
         """Initialize the paragraph first word checker.
         
@@ -347,11 +420,11 @@ class ParagraphFirstWordCheck(BaseInstruction):
         Returns:
             True if requirements are met, False otherwise.
         """
-        paragraphs = re.split(r"\n\n", value)
+        paragraphs = value.split("\n\n")
         num_paragraphs = len(paragraphs)
 
         for paragraph in paragraphs:
-            if not paragraph.strip():
+            if not paragraph or paragraph.isspace():
                 num_paragraphs -= 1
 
         # check that index doesn't go out of bounds
@@ -362,19 +435,13 @@ class ParagraphFirstWordCheck(BaseInstruction):
         else:
             return False
 
-        first_word = ""
-        punctuation = {".", ",", "?", "!", "'", '"'}
-
         # get first word and remove punctuation
-        word = paragraph.split()[0].strip()
+        word = paragraph.split(None, 1)[0]
         # Remove leading quotes
         word = word.lstrip("'")
         word = word.lstrip('"')
 
-        for letter in word:
-            if letter in punctuation:
-                break
-            first_word += letter.lower()
+        first_word = _WORD_BEFORE_PUNCTUATION_RE.match(word).group(0).lower()
 
         return (
             num_paragraphs == self._num_paragraphs
@@ -390,6 +457,8 @@ class ForbiddenWords(BaseInstruction):
     "Do not include keywords {forbidden_words} in the response."
     """
 
+    __slots__ = ("_forbidden_words", "_forbidden_re")
+
     def __init__(self, forbidden_words):
         """Initialize the forbidden words checker.
         
@@ -398,6 +467,12 @@ class ForbiddenWords(BaseInstruction):
                 allowed in the response.
         """
         self._forbidden_words = sorted(list(set(forbidden_words)))
+        # One alternation finds any forbidden word in a single scan instead of
+        # searching the response once per word.
+        self._forbidden_re = re.compile(
+            r"\b(?:" + "|".join(f"(?:{word})" for word in self._forbidden_words) + r")\b",
+            flags=re.IGNORECASE,
+        ) if self._forbidden_words else None
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -409,10 +484,9 @@ class ForbiddenWords(BaseInstruction):
 
     def check_following(self, value):
         """Check if the response does not contain the forbidden words."""
-        for word in self._forbidden_words:
-            if re.search(r"\b" + word + r"\b", value, flags=re.IGNORECASE):
-                return False
-        return True
+        if self._forbidden_re is None:
+            return True
+        return self._forbidden_re.search(value) is None
 
 
 @instruction_registry.register(_CHANGE_CASES + "english_capital")
@@ -423,6 +497,8 @@ class CapitalLettersEnglishChecker(BaseInstruction):
     "Your entire response should be in English, and in all capital letters."
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the capital letters checker."""
         pass
@@ -440,7 +516,7 @@ class CapitalLettersEnglishChecker(BaseInstruction):
         assert isinstance(value, str)
 
         try:
-            return value.isupper() and langdetect.detect(value) == "en"
+            return value.isupper() and detect_language(text=value) == "en"
         except langdetect.LangDetectException as e:
             # Count as instruction is followed.
             logging.error(
@@ -458,6 +534,8 @@ class LowercaseLettersEnglishChecker(BaseInstruction):
     letters. No capital letters are allowed."
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the lowercase letters checker."""
         pass
@@ -475,7 +553,7 @@ class LowercaseLettersEnglishChecker(BaseInstruction):
         assert isinstance(value, str)
 
         try:
-            return value.islower() and langdetect.detect(value) == "en"
+            return value.islower() and detect_language(text=value) == "en"
         except langdetect.LangDetectException as e:
             # Count as instruction is followed.
             logging.error(
@@ -493,6 +571,8 @@ class CapitalWordFrequencyChecker(BaseInstruction):
     {relation} {frequency} times."
     """
 
+    __slots__ = ("_frequency", "_comparison_relation", "_compare")
+
     def __init__(self, capital_frequency, capital_relation):
         """Initialize the capital word frequency checker.
         
@@ -510,6 +590,7 @@ class CapitalWordFrequencyChecker(BaseInstruction):
                 f"{COMPARISON_RELATION}, but {capital_relation} is given."
             )
         self._comparison_relation = capital_relation
+        self._compare = _COMPARISON_OPERATORS[capital_relation]
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -530,7 +611,4 @@ class CapitalWordFrequencyChecker(BaseInstruction):
 
         capital_words_count = len(capital_words)
 
-        if self._comparison_relation == COMPARISON_RELATION[0]:  # less than
-            return capital_words_count < self._frequency
-        else:  # at least
-            return capital_words_count >= self._frequency
\ No newline at end of file
+        return self._compare(capital_words_count, self._frequency)
\ No newline at end of file
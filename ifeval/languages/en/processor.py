@@ -5,7 +5,7 @@ import re
 from typing import List
 
 import nltk
-from nltk.tokenize import RegexpTokenizer, word_tokenize
+from nltk.tokenize import word_tokenize
 
 from ifeval.languages.language_processor import BaseLanguageProcessor
 from ifeval.languages.language_registry import LanguageRegistry
@@ -20,15 +20,43 @@ _WEBSITES = "[.](com|net|org|io|gov|edu|me)"
 _DIGITS = "([0-9])"
 _MULTIPLE_DOTS = r"\.{2,}"
 
+# Compiled once at import, in the order they are applied by split_into_sentences
+_PREFIXES_RE = re.compile(_PREFIXES)
+_WEBSITES_RE = re.compile(_WEBSITES)
+_DECIMAL_RE = re.compile(_DIGITS + "[.]" + _DIGITS)
+_MULTIPLE_DOTS_RE = re.compile(_MULTIPLE_DOTS)
+_SINGLE_LETTER_RE = re.compile(r"\s" + _ALPHABETS + "[.] ")
+_ACRONYM_STARTER_RE = re.compile(_ACRONYMS + " " + _STARTERS)
+_THREE_LETTER_ABBR_RE = re.compile(_ALPHABETS + "[.]" + _ALPHABETS + "[.]" + _ALPHABETS + "[.]")
+_TWO_LETTER_ABBR_RE = re.compile(_ALPHABETS + "[.]" + _ALPHABETS + "[.]")
+_SUFFIX_STARTER_RE = re.compile(" " + _SUFFIXES + "[.] " + _STARTERS)
+_SUFFIX_RE = re.compile(" " + _SUFFIXES + "[.]")
+_LETTER_DOT_RE = re.compile(" " + _ALPHABETS + "[.]")
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sentence_tokenizer():
+    """Get NLTK sentence tokenizer, loaded once and shared by all instances."""
+    return nltk.data.load("nltk:tokenizers/punkt/english.pickle")
+
+
+@functools.lru_cache(maxsize=1024)
+def _count_sentences(text: str) -> int:
+    """Count Punkt sentences in text, cached across calls."""
+    return len(_get_sentence_tokenizer().tokenize(text))
+
+
+@functools.lru_cache(maxsize=1024)
+def _count_words(text: str) -> int:
+    """Count words in text, cached across calls."""
+    return len(_WORD_RE.findall(text))
+
 
 class EnglishProcessor(BaseLanguageProcessor):
     """English language processor implementation."""
     
-    @functools.lru_cache(maxsize=None)
-    def _get_sentence_tokenizer(self):
-        """Get NLTK sentence tokenizer, with caching."""
-        return nltk.data.load("nltk:tokenizers/punkt/english.pickle")
-    
     def count_sentences(self, text: str) -> int:
         """Count the number of sentences in text.
         
@@ -38,9 +66,7 @@ class EnglishProcessor(BaseLanguageProcessor):
         Returns:
             Number of sentences.
         """
-        tokenizer = self._get_sentence_tokenizer()
-        sentences = tokenizer.tokenize(text)
-        return len(sentences)
+        return _count_sentences(text)
     
     def count_words(self, text: str) -> int:
         """Count the number of words in text.
@@ -51,9 +77,7 @@ class EnglishProcessor(BaseLanguageProcessor):
         Returns:
             Number of words.
         """
-        tokenizer = RegexpTokenizer(r"\w+")
-        tokens = tokenizer.tokenize(text)
-        return len(tokens)
+        return _count_words(text)
     
     def split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences.
@@ -66,27 +90,22 @@ class EnglishProcessor(BaseLanguageProcessor):
         """
         text = " " + text + "  "
         text = text.replace("\n", " ")
-        text = re.sub(_PREFIXES, "\\1<prd>", text)
-        text = re.sub(_WEBSITES, "<prd>\\1", text)
-        text = re.sub(_DIGITS + "[.]" + _DIGITS, "\\1<prd>\\2", text)
-        text = re.sub(
-            _MULTIPLE_DOTS,
+        text = _PREFIXES_RE.sub("\\1<prd>", text)
+        text = _WEBSITES_RE.sub("<prd>\\1", text)
+        text = _DECIMAL_RE.sub("\\1<prd>\\2", text)
+        text = _MULTIPLE_DOTS_RE.sub(
             lambda match: "<prd>" * len(match.group(0)) + "<stop>",
             text,
         )
         if "Ph.D" in text:
             text = text.replace("Ph.D.", "Ph<prd>D<prd>")
-        text = re.sub(r"\s" + _ALPHABETS + "[.] ", " \\1<prd> ", text)
-        text = re.sub(_ACRONYMS + " " + _STARTERS, "\\1<stop> \\2", text)
-        text = re.sub(
-            _ALPHABETS + "[.]" + _ALPHABETS + "[.]" + _ALPHABETS + "[.]",
-            "\\1<prd>\\2<prd>\\3<prd>",
-            text,
-        )
-        text = re.sub(_ALPHABETS + "[.]" + _ALPHABETS + "[.]", "\\1<prd>\\2<prd>", text)
-        text = re.sub(" " + _SUFFIXES + "[.] " + _STARTERS, " \\1<stop> \\2", text)
-        text = re.sub(" " + _SUFFIXES + "[.]", " \\1<prd>", text)
-        text = re.sub(" " + _ALPHABETS + "[.]", " \\1<prd>", text)
+        text = _SINGLE_LETTER_RE.sub(" \\1<prd> ", text)
+        text = _ACRONYM_STARTER_RE.sub("\\1<stop> \\2", text)
+        text = _THREE_LETTER_ABBR_RE.sub("\\1<prd>\\2<prd>\\3<prd>", text)
+        text = _TWO_LETTER_ABBR_RE.sub("\\1<prd>\\2<prd>", text)
+        text = _SUFFIX_STARTER_RE.sub(" \\1<stop> \\2", text)
+        text = _SUFFIX_RE.sub(" \\1<prd>", text)
+        text = _LETTER_DOT_RE.sub(" \\1<prd>", text)
         if "\"" in text:
             text = text.replace("."", "".")
         if '"' in text:
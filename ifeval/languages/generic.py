@@ -1,9 +1,9 @@
 """Generic language-agnostic instruction implementations."""
 
 import json
+import operator
 from absl import logging
 import re
-import collections
 
 from ifeval.core import legacy_behavior
 from ifeval.core.instructions import BaseInstruction
@@ -18,6 +18,36 @@ DEFAULT_NUM_PARAGRAPHS = 5
 # Generic constants for use in multilingual code
 COMPARISON_RELATION = ("less than", "at least")
 
+# Characters that give a user-supplied pattern meaning beyond its literal text.
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# Comparison used by each relation in COMPARISON_RELATION.
+_COMPARISON_OPERATORS = {
+    COMPARISON_RELATION[0]: operator.lt,  # less than
+    COMPARISON_RELATION[1]: operator.ge,  # at least
+}
+
+# Patterns used by the checkers below, compiled once at import
+_PLACEHOLDER_RE = re.compile(r"\[.*?\]")
+# One scan counting both "* item" and "- item" bullets. A "*" bullet whose
+# "[^\*]" is a newline also swallows the next line; if that line is a "-"
+# bullet the lookahead ends the "*" match early so it is still counted.
+_BULLET_RE = re.compile(
+    r"^\s*(?:\*(?:(?=\n[^\S\n]*-)|[^\*]).*$|-.*$)", flags=re.MULTILINE
+)
+_HIGHLIGHT_RE = re.compile(r"\*[^\n\*]*\*")
+_DOUBLE_HIGHLIGHT_RE = re.compile(r"\*\*[^\n\*]*\*\*")
+_TITLE_RE = re.compile(r"<<[^\n]+>>")
+_POSTSCRIPT_PPS_RE = re.compile(r"\s*p\.\s?p\.\s?s.*$", flags=re.MULTILINE)
+_POSTSCRIPT_PS_RE = re.compile(r"\s*p\.\s?s\..*$", flags=re.MULTILINE)
+_JSON_FENCE_PREFIXES = ("```json", "```Json", "```JSON", "```")
+_JSON_DECODER = json.JSONDecoder()
+
+# The only letter whose lowercase form depends on the surrounding letters
+# (final sigma), so lowercasing a slice of text containing it can differ from
+# slicing the lowercased text.
+_CONTEXT_CASED_LETTER = "\u03a3"
+
 class PlaceholderChecker(BaseInstruction):
     """Check if response contains placeholders in square brackets.
     
@@ -25,6 +55,8 @@ class PlaceholderChecker(BaseInstruction):
     "The response must contain at least {num_placeholders} placeholders 
     represented by square brackets, such as [address]."
     """
+
+    __slots__ = ("_num_placeholders",)
     
     def __init__(self, num_placeholders):
         """Initialize the placeholder checker.
@@ -53,8 +85,11 @@ class PlaceholderChecker(BaseInstruction):
             True if the actual number of placeholders in the response is greater than
             or equal to `num_placeholders`; otherwise, False.
         """
-        placeholders = re.findall(r"\[.*?\]", value)
-        num_placeholders = len(placeholders)
+        num_placeholders = 0
+        for _ in _PLACEHOLDER_RE.finditer(value):
+            num_placeholders += 1
+            if num_placeholders >= self._num_placeholders:
+                break
         return num_placeholders >= self._num_placeholders
 
 
@@ -67,6 +102,8 @@ class BulletListChecker(BaseInstruction):
     * This is point 1.
     * This is point 2"
     """
+
+    __slots__ = ("_num_bullets",)
     
     def __init__(self, num_bullets):
         """Initialize the bullet list checker.
@@ -95,9 +132,12 @@ class BulletListChecker(BaseInstruction):
             True if the actual number of bullet lists in the response meets the
             requirement.
         """
-        bullet_lists = re.findall(r"^\s*\*[^\*].*$", value, flags=re.MULTILINE)
-        bullet_lists_2 = re.findall(r"^\s*-.*$", value, flags=re.MULTILINE)
-        num_bullet_lists = len(bullet_lists) + len(bullet_lists_2)
+        num_bullet_lists = 0
+        for _ in _BULLET_RE.finditer(value):
+            num_bullet_lists += 1
+            # Too many bullets already; the count can only grow.
+            if num_bullet_lists > self._num_bullets:
+                return False
         return num_bullet_lists == self._num_bullets
 
 
@@ -108,6 +148,8 @@ class HighlightSectionChecker(BaseInstruction):
     "Highlight at least {num_highlights} sections in your answer with 
     markdown, i.e. *highlighted section*."
     """
+
+    __slots__ = ("_num_highlights",)
     
     def __init__(self, num_highlights):
         """Initialize the highlighted section checker.
@@ -135,17 +177,21 @@ class HighlightSectionChecker(BaseInstruction):
         Returns:
             True if the actual number of highlighted sections meets the minimum requirement.
         """
+        if self._num_highlights <= 0:
+            return True
         num_highlights = 0
-        highlights = re.findall(r"\*[^\n\*]*\*", value)
-        double_highlights = re.findall(r"\*\*[^\n\*]*\*\*", value)
-        for highlight in highlights:
-            if highlight.strip("*").strip():
+        for match in _HIGHLIGHT_RE.finditer(value):
+            if match.group(0).strip("*").strip():
                 num_highlights += 1
-        for highlight in double_highlights:
-            if highlight.removeprefix("**").removesuffix("**").strip():
+                if num_highlights >= self._num_highlights:
+                    return True
+        for match in _DOUBLE_HIGHLIGHT_RE.finditer(value):
+            if match.group(0).removeprefix("**").removesuffix("**").strip():
                 num_highlights += 1
+                if num_highlights >= self._num_highlights:
+                    return True
 
-        return num_highlights >= self._num_highlights
+        return False
 
 
 class ParagraphChecker(BaseInstruction):
@@ -155,6 +201,8 @@ class ParagraphChecker(BaseInstruction):
     "There should be {num_paragraphs} paragraphs.
     Paragraphs are separated with the markdown divider: ***"
     """
+
+    __slots__ = ("_num_paragraphs",)
     
     def __init__(self, num_paragraphs):
         """Initialize the paragraph checker.
@@ -181,11 +229,21 @@ class ParagraphChecker(BaseInstruction):
         Returns:
             True if the actual number of paragraphs is the same as required.
         """
-        paragraphs = re.split(r"\s?\*\*\*\s?", value)
+        # Each "***" adds one piece and at most the first and last pieces are
+        # dropped as empty, so the count can only land within one of the
+        # number of delimiters.
+        num_delimiters = value.count("***")
+        if not num_delimiters - 1 <= self._num_paragraphs <= num_delimiters + 1:
+            return False
+
+        # Splitting on the bare "***" yields the same pieces as the original
+        # r"\s?\*\*\*\s?" split, up to surrounding whitespace, which only
+        # matters for the emptiness check below where it is stripped anyway.
+        paragraphs = value.split("***")
         num_paragraphs = len(paragraphs)
 
         for index, paragraph in enumerate(paragraphs):
-            if not paragraph.strip():
+            if not paragraph or paragraph.isspace():
                 if index == 0 or index == len(paragraphs) - 1:
                     num_paragraphs -= 1
                 else:
@@ -201,6 +259,8 @@ class JsonFormat(BaseInstruction):
     "Entire output should be wrapped in JSON format. You can use markdown
     ticks such as ```."
     """
+
+    __slots__ = ()
     
     def __init__(self):
         """Initialize the JSON format checker."""
@@ -223,17 +283,25 @@ class JsonFormat(BaseInstruction):
         Returns:
             True if the response is valid JSON.
         """
-        value = (
-            value.strip()
-            .removeprefix("```json")
-            .removeprefix("```Json")
-            .removeprefix("```JSON")
-            .removeprefix("```")
-            .removesuffix("```")
-            .strip()
-        )
+        # Strip whitespace and markdown fences by moving indices, so only the
+        # final JSON candidate is copied. The prefixes are removed one after
+        # another, like chained removeprefix calls.
+        start, end = 0, len(value)
+        while start < end and value[start].isspace():
+            start += 1
+        while end > start and value[end - 1].isspace():
+            end -= 1
+        for prefix in _JSON_FENCE_PREFIXES:
+            if value.startswith(prefix, start, end):
+                start += len(prefix)
+        if value.endswith("```", start, end):
+            end -= 3
+        while start < end and value[start].isspace():
+            start += 1
+        while end > start and value[end - 1].isspace():
+            end -= 1
         try:
-            json.loads(value)
+            _JSON_DECODER.decode(value[start:end])
         except ValueError:
             return False
         return True
@@ -246,6 +314,8 @@ class TwoResponsesChecker(BaseInstruction):
     "Give two different responses. Responses and only responses should
     be separated by 6 asterisk symbols: ******."
     """
+
+    __slots__ = ()
     
     def __init__(self):
         """Initialize the two responses checker."""
@@ -271,11 +341,13 @@ class TwoResponsesChecker(BaseInstruction):
         valid_responses = list()
         responses = value.split("******")
         for index, response in enumerate(responses):
-            if not response.strip():
+            if not response or response.isspace():
                 if index != 0 and index != len(responses) - 1:
                     return False
             else:
                 valid_responses.append(response)
+                if len(valid_responses) > 2:
+                    return False
         return (
             len(valid_responses) == 2
             and valid_responses[0].strip() != valid_responses[1].strip()
@@ -289,6 +361,8 @@ class TitleChecker(BaseInstruction):
     "Your answer must contain a title, wrapped in double angular brackets,
     such as <<poem of joy>>."
     """
+
+    __slots__ = ()
     
     def __init__(self):
         """Initialize the title checker."""
@@ -311,12 +385,8 @@ class TitleChecker(BaseInstruction):
         Returns:
             True if the response contains a title in double angular brackets.
         """
-        pattern = r"<<[^\n]+>>"
-        re_pattern = re.compile(pattern)
-        titles = re.findall(re_pattern, value)
-
-        for title in titles:
-            if title.lstrip("<").rstrip(">").strip():
+        for match in _TITLE_RE.finditer(value):
+            if match.group(0).lstrip("<").rstrip(">").strip():
                 return True
         return False
 
@@ -327,6 +397,8 @@ class CommaChecker(BaseInstruction):
     Example description:
     "In your entire response, refrain from the use of any commas."
     """
+
+    __slots__ = ()
     
     def __init__(self):
         """Initialize the comma checker."""
@@ -349,7 +421,7 @@ class CommaChecker(BaseInstruction):
         Returns:
             True if the response does not contain commas.
         """
-        return not re.search(r",", value)
+        return "," not in value
 
 
 class QuotationChecker(BaseInstruction):
@@ -358,6 +430,8 @@ class QuotationChecker(BaseInstruction):
     Example description:
     "Wrap your entire response with double quotation marks."
     """
+
+    __slots__ = ()
     
     def __init__(self):
         """Initialize the quotation checker."""
@@ -380,8 +454,13 @@ class QuotationChecker(BaseInstruction):
         Returns:
             True if the response is wrapped with double quotation marks.
         """
-        value = value.strip()
-        return len(value) > 1 and value[0] == '"' and value[-1] == '"'
+        # Find the bounds of the stripped response without copying it.
+        start, end = 0, len(value)
+        while start < end and value[start].isspace():
+            start += 1
+        while end > start and value[end - 1].isspace():
+            end -= 1
+        return end - start > 1 and value[start] == '"' and value[end - 1] == '"'
 
 
 class SectionChecker(BaseInstruction):
@@ -396,6 +475,8 @@ class SectionChecker(BaseInstruction):
     [content of section 2]"
     """
 
+    __slots__ = ("_section_spliter", "_num_sections", "_section_re")
+
     def __init__(self, section_spliter, num_sections):
         """Initialize the section checker.
         
@@ -408,6 +489,11 @@ class SectionChecker(BaseInstruction):
         """
         self._section_spliter = section_spliter.strip() if isinstance(section_spliter, str) else section_spliter
         self._num_sections = num_sections
+        # This is a more general regex compared to original implementation
+        # in that it allows for letters
+        self._section_re = re.compile(
+            r"\s?" + re.escape(self._section_spliter) + r"\s?(?:[0-9]|[a-zA-Z])"
+        )
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -429,12 +515,12 @@ class SectionChecker(BaseInstruction):
         Returns:
             True if the number of sections in the response is sufficient.
         """
-        # This is a more general regex compared to original implementation
-        # in that it allows for letters
-        section_splitter_pattern = r"\s?" + self._section_spliter + r"\s?(?:[0-9]|[a-zA-Z])"
-            
-        sections = re.split(section_splitter_pattern, value)
-        num_sections = len(sections) - 1
+        # Every splitter match starts a new section.
+        num_sections = 0
+        for _ in self._section_re.finditer(value):
+            num_sections += 1
+            if num_sections >= self._num_sections:
+                break
         return num_sections >= self._num_sections
 
 
@@ -446,6 +532,8 @@ class PostscriptChecker(BaseInstruction):
     starting with {postscript}"
     """
 
+    __slots__ = ("_postscript_marker", "_postscript_re", "_postscript_lower")
+
     def __init__(self, postscript_marker):
         """Initialize the postscript checker.
         
@@ -454,6 +542,19 @@ class PostscriptChecker(BaseInstruction):
                 of the postscript section.
         """
         self._postscript_marker = postscript_marker.strip() if isinstance(postscript_marker, str) else postscript_marker
+        self._postscript_re = None
+        self._postscript_lower = None
+        if self._postscript_marker == "P.P.S":
+            self._postscript_re = _POSTSCRIPT_PPS_RE
+        elif self._postscript_marker == "P.S.":
+            self._postscript_re = _POSTSCRIPT_PS_RE
+        elif isinstance(self._postscript_marker, str):
+            marker = self._postscript_marker.lower()
+            if REGEX_METACHARACTERS.isdisjoint(marker):
+                # r"\s*<marker>.*$" matches exactly where the marker occurs.
+                self._postscript_lower = marker
+            else:
+                self._postscript_re = re.compile(r"\s*" + marker + r".*$", flags=re.MULTILINE)
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -473,14 +574,9 @@ class PostscriptChecker(BaseInstruction):
             True if the response contains a postscript section.
         """
         value = value.lower()
-        if self._postscript_marker == "P.P.S":
-            postscript_pattern = r"\s*p\.\s?p\.\s?s.*$"
-        elif self._postscript_marker == "P.S.":
-            postscript_pattern = r"\s*p\.\s?s\..*$"
-        else:
-            postscript_pattern = r"\s*" + self._postscript_marker.lower() + r".*$"
-        postscript = re.findall(postscript_pattern, value, flags=re.MULTILINE)
-        return True if postscript else False
+        if self._postscript_re is None:
+            return self._postscript_lower in value
+        return self._postscript_re.search(value) is not None
 
 
 class RepeatPromptThenAnswer(BaseInstruction):
@@ -493,6 +589,8 @@ class RepeatPromptThenAnswer(BaseInstruction):
     does not include this sentence)"
     """
 
+    __slots__ = ("_prompt_to_repeat", "_prompt_lower")
+
     def __init__(self, prompt_to_repeat=None):
         """Initialize the repeat prompt checker.
         
@@ -503,6 +601,7 @@ class RepeatPromptThenAnswer(BaseInstruction):
             raise ValueError("prompt_to_repeat must be set.")
         else:
             self._prompt_to_repeat = prompt_to_repeat
+        self._prompt_lower = prompt_to_repeat.strip().lower()
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -514,9 +613,12 @@ class RepeatPromptThenAnswer(BaseInstruction):
 
     def check_following(self, value):
         """Check if the response starts by repeating the prompt."""
-        if value.strip().lower().startswith(self._prompt_to_repeat.strip().lower()):
-            return True
-        return False
+        # Only the head of the response can match, so lowercase just that part
+        # instead of copying the whole response.
+        head = value.lstrip()[:len(self._prompt_lower)]
+        if _CONTEXT_CASED_LETTER in head:
+            return value.strip().lower().startswith(self._prompt_lower)
+        return head.lower().startswith(self._prompt_lower)
 
 
 class EndChecker(BaseInstruction):
@@ -527,6 +629,8 @@ class EndChecker(BaseInstruction):
     No other words should follow this phrase."
     """
 
+    __slots__ = ("_end_phrase", "_end_phrase_lower")
+
     def __init__(self, end_phrase):
         """Initialize the end phrase checker.
         
@@ -534,6 +638,7 @@ class EndChecker(BaseInstruction):
             end_phrase: A string representing the phrase the response should end with.
         """
         self._end_phrase = end_phrase.strip() if isinstance(end_phrase, str) else end_phrase
+        self._end_phrase_lower = self._end_phrase.lower() if isinstance(self._end_phrase, str) else self._end_phrase
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -545,9 +650,12 @@ class EndChecker(BaseInstruction):
 
     def check_following(self, value):
         """Checks if the response ends with the expected phrase."""
-        value = value.strip().strip('"').lower()
-        self._end_phrase = self._end_phrase.strip().lower()
-        return value.endswith(self._end_phrase)
+        value = value.strip().strip('"')
+        # Only the tail of the response can match, so lowercase just that part.
+        tail = value[max(len(value) - len(self._end_phrase_lower), 0):]
+        if _CONTEXT_CASED_LETTER in tail:
+            return value.lower().endswith(self._end_phrase_lower)
+        return tail.lower().endswith(self._end_phrase_lower)
 
 
 class LetterFrequencyChecker(BaseInstruction):
@@ -558,6 +666,8 @@ class LetterFrequencyChecker(BaseInstruction):
     {let_frequency} times."
     """
 
+    __slots__ = ("_letter", "_frequency", "_comparison_relation", "_compare")
+
     def __init__(self, letter, let_frequency, let_relation):
         """Initialize the letter frequency checker.
         
@@ -578,6 +688,7 @@ class LetterFrequencyChecker(BaseInstruction):
             )
         
         self._comparison_relation = let_relation
+        self._compare = _COMPARISON_OPERATORS[let_relation]
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -593,13 +704,14 @@ class LetterFrequencyChecker(BaseInstruction):
 
     def check_following(self, value):
         """Checks that the response contains the letter at the right frequency."""
-        value = value.lower()
-        letters = collections.Counter(value)
+        # Only single characters are ever counted; anything longer never
+        # occurs as a character of the response.
+        if len(self._letter) == 1:
+            letter_count = value.lower().count(self._letter)
+        else:
+            letter_count = 0
 
-        if self._comparison_relation == COMPARISON_RELATION[0]:  # less than
-            return letters[self._letter] < self._frequency
-        else:  # at least
-            return letters[self._letter] >= self._frequency
+        return self._compare(letter_count, self._frequency)
         
 
 class ResponseLanguageChecker(BaseInstruction):
@@ -610,6 +722,8 @@ class ResponseLanguageChecker(BaseInstruction):
     language is allowed."
     """
 
+    __slots__ = ("_language",)
+
     def __init__(self, language=None):
         """Initialize the language checker.
         
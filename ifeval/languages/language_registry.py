@@ -1,6 +1,6 @@
 """Registry for language processors."""
 
-import immutabledict
+import types
 from typing import Dict, Type, Optional, Callable, TypeVar
 
 from ifeval.languages.language_processor import BaseLanguageProcessor
@@ -8,7 +8,7 @@ from ifeval.languages.language_processor import BaseLanguageProcessor
 T = TypeVar('T', bound=BaseLanguageProcessor)
 
 # ISO 639-1 codes to language names.
-LANGUAGE_CODES = immutabledict.immutabledict({
+LANGUAGE_CODES = types.MappingProxyType({
     "en": "English",
     "es": "Spanish",
     "pt": "Portuguese",
@@ -75,9 +75,10 @@ class LanguageRegistry:
         Raises:
             ValueError: If the language is not supported.
         """
-        if language_code not in self._processors:
+        processor_cls = self._processors.get(language_code)
+        if processor_cls is None:
             raise ValueError(f"Unsupported language: {language_code}")
-        return self._processors[language_code]
+        return processor_cls
     
     def create_processor(self, language_code: str) -> BaseLanguageProcessor:
         """Create a language processor instance.
@@ -105,6 +106,7 @@ class LanguageRegistry:
         Raises:
             ValueError: If the language is not supported.
         """
-        if language_code not in LANGUAGE_CODES:
+        language_name = LANGUAGE_CODES.get(language_code)
+        if language_name is None:
             raise ValueError(f"Unknown language code: {language_code}")
-        return LANGUAGE_CODES[language_code]
\ No newline at end of file
+        return language_name
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Russian language instruction implementations."""
 
 import collections
+import operator
 import random
 import re
 
@@ -32,7 +33,8 @@ from ifeval.languages.generic import (
     RepeatPromptThenAnswer,
     EndChecker,
     LetterFrequencyChecker,
-    ResponseLanguageChecker
+    ResponseLanguageChecker,
+    REGEX_METACHARACTERS,
 )
 
 # Create registry and processor instances
@@ -51,6 +53,20 @@ _STARTEND = "startend:"
 _CHANGE_CASES = "change_case:"
 _PUNCTUATION = "punctuation:"
 
+# Comparison used by each relation in COMPARISON_RELATION.
+_COMPARISON_OPERATORS = {
+    COMPARISON_RELATION[0]: operator.lt,  # less than
+    COMPARISON_RELATION[1]: operator.ge,  # at least
+}
+
+# Leading part of a word up to the first punctuation mark.
+_WORD_BEFORE_PUNCTUATION_RE = re.compile(r"[^.,?!'\"]*")
+
+# Matches any of the constrained response options in a single scan.
+_CONSTRAINED_RESPONSE_RE = re.compile(
+    "|".join(re.escape(option) for option in CONSTRAINED_RESPONSE_OPTIONS)
+)
+
 # Register generic instructions
 instruction_registry.register(_CONTENT + "number_placeholders")(PlaceholderChecker)
 instruction_registry.register(_FORMAT + "number_bullet_lists")(BulletListChecker)
@@ -78,6 +94,12 @@ class NumberOfSentences(BaseInstruction):
     "Ваш ответ должен содержать {relation} {num_sentences} предложений."
     """
 
+    __slots__ = (
+        "_num_sentences_threshold",
+        "_comparison_relation",
+        "_compare",
+    )
+
     def __init__(self, num_sentences, relation):
         """Initialize the sentence number checker.
         
@@ -97,6 +119,7 @@ class NumberOfSentences(BaseInstruction):
             )
         
         self._comparison_relation = relation
+        self._compare = _COMPARISON_OPERATORS[relation]
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -119,10 +142,7 @@ class NumberOfSentences(BaseInstruction):
             True if the response follows the instruction.
         """
         num_sentences = processor.count_sentences(value)
-        if self._comparison_relation == "less than":
-            return num_sentences < self._num_sentences_threshold
-        elif self._comparison_relation == "at least":
-            return num_sentences >= self._num_sentences_threshold
+        return self._compare(num_sentences, self._num_sentences_threshold)
 
 
 @instruction_registry.register(_FORMAT + "constrained_response")
@@ -133,10 +153,11 @@ class ConstrainedResponseChecker(BaseInstruction):
     "Ответьте одним из следующих вариантов: {response_options}"
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the constrained response checker."""
-        # A sequence of string(s) representing the options of the expected response.
-        self._constrained_responses = CONSTRAINED_RESPONSE_OPTIONS
+        pass
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -155,11 +176,7 @@ class ConstrainedResponseChecker(BaseInstruction):
         Returns:
             True if the actual response contains one of the options.
         """
-        value = value.strip()
-        for constrained_response in self._constrained_responses:
-            if constrained_response in value:
-                return True
-        return False
+        return _CONSTRAINED_RESPONSE_RE.search(value) is not None
 
 
 @instruction_registry.register(_KEYWORD + "existence")
@@ -170,6 +187,8 @@ class KeywordChecker(BaseInstruction):
     "Включите ключевые слова {keywords} в ответ."
     """
 
+    __slots__ = ("_keywords", "_keyword_lemmas", "_keyword_res")
+
     def __init__(self, keywords):
         """Initialize the keyword checker.
         
@@ -178,6 +197,13 @@ class KeywordChecker(BaseInstruction):
                 expected in the response.
         """
         self._keywords = sorted(keywords)
+        self._keyword_lemmas = [
+            processor.lemmatize(keyword) for keyword in self._keywords
+        ]
+        self._keyword_res = [
+            re.compile(keyword_lemma, flags=re.IGNORECASE)
+            for keyword_lemma in self._keyword_lemmas
+        ]
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -189,8 +215,17 @@ class KeywordChecker(BaseInstruction):
 
     def check_following(self, value):
         """Check if the response contain the expected keywords."""
-        for keyword in self._keywords:
-            if not re.search(processor.lemmatize(keyword), processor.lemmatize(value), flags=re.IGNORECASE):
+        lemmatized_value = processor.lemmatize(value)
+        for keyword_lemma, keyword_re in zip(self._keyword_lemmas, self._keyword_res):
+            # A lemma without regex syntax matches wherever it occurs as an
+            # exact substring, so the regex is only needed when the plain
+            # scan finds nothing.
+            if (
+                REGEX_METACHARACTERS.isdisjoint(keyword_lemma)
+                and keyword_lemma in lemmatized_value
+            ):
+                continue
+            if not keyword_re.search(lemmatized_value):
                 return False
         return True
 
@@ -204,6 +239,14 @@ class KeywordFrequencyChecker(BaseInstruction):
     {frequency} раз."
     """
 
+    __slots__ = (
+        "_keyword",
+        "_keyword_re",
+        "_frequency",
+        "_comparison_relation",
+        "_compare",
+    )
+
     def __init__(self, keyword, frequency, relation):
         """Initialize the keyword frequency checker.
         
@@ -215,6 +258,9 @@ class KeywordFrequencyChecker(BaseInstruction):
                 operator for comparison.
         """
         self._keyword = keyword.strip()
+        self._keyword_re = re.compile(
+            processor.lemmatize(self._keyword), flags=re.IGNORECASE
+        )
         self._frequency = frequency
 
         if relation not in COMPARISON_RELATION:
@@ -224,6 +270,7 @@ class KeywordFrequencyChecker(BaseInstruction):
             )
         
         self._comparison_relation = relation
+        self._compare = _COMPARISON_OPERATORS[relation]
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -239,14 +286,15 @@ class KeywordFrequencyChecker(BaseInstruction):
 
     def check_following(self, value):
         """Checks if the response contain the keyword with required frequency."""
-        actual_occurrences = len(
-            re.findall(processor.lemmatize(self._keyword), processor.lemmatize(value), flags=re.IGNORECASE)
-        )
+        # Both relations are decided once the count reaches the threshold,
+        # so there is no need to scan past it.
+        actual_occurrences = 0
+        for _ in self._keyword_re.finditer(processor.lemmatize(value)):
+            actual_occurrences += 1
+            if actual_occurrences >= self._frequency:
+                break
 
-        if self._comparison_relation == "less than":
-            return actual_occurrences < self._frequency
-        elif self._comparison_relation == "at least":
-            return actual_occurrences >= self._frequency
+        return self._compare(actual_occurrences, self._frequency)
 
 
 @instruction_registry.register(_LENGTH + "number_words")
@@ -257,6 +305,8 @@ class NumberOfWords(BaseInstruction):
     "Ответьте, используя {relation} {num_words} слов."
     """
 
+    __slots__ = ("_num_words", "_comparison_relation", "_compare")
+
     def __init__(self, num_words, relation):
         """Initialize the word count checker.
         
@@ -275,6 +325,7 @@ class NumberOfWords(BaseInstruction):
             )
         
         self._comparison_relation = relation
+        self._compare = _COMPARISON_OPERATORS[relation]
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -288,10 +339,7 @@ class NumberOfWords(BaseInstruction):
         """Checks if the response contains the expected number of words."""
         num_words = processor.count_words(value)
 
-        if self._comparison_relation == "less than":
-            return num_words < self._num_words
-        elif self._comparison_relation == "at least":
-            return num_words >= self._num_words
+        return self._compare(num_words, self._num_words)
 
 
 @instruction_registry.register(_LENGTH + "nth_paragraph_first_word")
@@ -305,6 +353,8 @@ class ParagraphFirstWordCheck(BaseInstruction):
     Абзац {nth_paragraph} должен начинаться со слова {first_word}."
     """
 
+    __slots__ = ("_num_paragraphs", "_nth_paragraph", "_first_word")
+
     def __init__(self, num_paragraphs, nth_paragraph, first_word):
         """Initialize the paragraph first word checker.
         
@@ -344,11 +394,11 @@ class ParagraphFirstWordCheck(BaseInstruction):
         Returns:
             True if requirements are met, False otherwise.
         """
-        paragraphs = re.split(r"\n\n", value)
+        paragraphs = value.split("\n\n")
         num_paragraphs = len(paragraphs)
 
         for paragraph in paragraphs:
-            if not paragraph.strip():
+            if not paragraph or paragraph.isspace():
                 num_paragraphs -= 1
 
         # check that index doesn't go out of bounds
@@ -359,19 +409,13 @@ class ParagraphFirstWordCheck(BaseInstruction):
         else:
             return False
 
-        first_word = ""
-        punctuation = {".", ",", "?", "!", "'", '"'}
-
         # get first word and remove punctuation
-        word = paragraph.split()[0].strip()
+        word = paragraph.split(None, 1)[0]
         # Remove leading quotes
         word = word.lstrip("'")
         word = word.lstrip('"')
 
-        for letter in word:
-            if letter in punctuation:
-                break
-            first_word += letter.lower()
+        first_word = _WORD_BEFORE_PUNCTUATION_RE.match(word).group(0).lower()
 
         return (
             num_paragraphs == self._num_paragraphs
@@ -387,6 +431,8 @@ class ForbiddenWords(BaseInstruction):
     "Не включайте ключевые слова {forbidden_words} в ответ."
     """
 
+    __slots__ = ("_forbidden_words", "_forbidden_re")
+
     def __init__(self, forbidden_words):
         """Initialize the forbidden words checker.
         
@@ -395,6 +441,14 @@ class ForbiddenWords(BaseInstruction):
                 allowed in the response.
         """
         self._forbidden_words = sorted(list(set(forbidden_words)))
+        # One alternation over the lemmas finds any forbidden word in a single
+        # scan of the lemmatized response.
+        self._forbidden_re = re.compile(
+            r"\b(?:"
+            + "|".join(f"(?:{processor.lemmatize(word)})" for word in self._forbidden_words)
+            + r")\b",
+            flags=re.IGNORECASE,
+        ) if self._forbidden_words else None
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -406,10 +460,9 @@ class ForbiddenWords(BaseInstruction):
 
     def check_following(self, value):
         """Check if the response does not contain the forbidden words."""
-        for word in self._forbidden_words:
-            if re.search(r"\b" + processor.lemmatize(word) + r"\b", processor.lemmatize(value), flags=re.IGNORECASE):
-                return False
-        return True
+        if self._forbidden_re is None:
+            return True
+        return self._forbidden_re.search(processor.lemmatize(value)) is None
 
 
 @instruction_registry.register(_CHANGE_CASES + "english_capital")
@@ -420,6 +473,8 @@ class CapitalLettersRussianChecker(BaseInstruction):
     "Весь ваш ответ должен быть на русском языке и заглавными буквами."
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the capital letters checker."""
         pass
@@ -456,6 +511,8 @@ class LowercaseLettersRussianChecker(BaseInstruction):
     буквами. Заглавные буквы не допускаются."
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the lowercase letters checker."""
         pass
@@ -492,6 +549,8 @@ class CapitalWordFrequencyChecker(BaseInstruction):
     встречаться {relation} {frequency} раз."
     """
 
+    __slots__ = ("_frequency", "_comparison_relation", "_compare")
+
     def __init__(self, capital_frequency, capital_relation):
         """Initialize the capital word frequency checker.
         
@@ -509,6 +568,7 @@ class CapitalWordFrequencyChecker(BaseInstruction):
                 f"{COMPARISON_RELATION}, but {capital_relation} is given."
             )
         self._comparison_relation = capital_relation
+        self._compare = _COMPARISON_OPERATORS[capital_relation]
 
     def get_instruction_args(self):
         """Returns the keyword args of the instruction."""
@@ -529,7 +589,4 @@ class CapitalWordFrequencyChecker(BaseInstruction):
 
         capital_words_count = len(capital_words)
 
-        if self._comparison_relation == "less than":
-            return capital_words_count < self._frequency
-        else:  # at least
-            return capital_words_count >= self._frequency
\ No newline at end of file
+        return self._compare(capital_words_count, self._frequency)
\ No newline at end of file
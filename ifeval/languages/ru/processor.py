@@ -5,7 +5,6 @@ import re
 from typing import List
 
 import nltk
-from nltk.tokenize import RegexpTokenizer
 # Optional pymorphy2 import for lemmatization; provide fallback if unavailable
 try:
     from pymorphy2 import MorphAnalyzer
@@ -30,16 +29,63 @@ _MULTIPLE_DOTS = r"\.{2,}"
 
 # Pattern for removing Latin characters and symbols
 _LATIN_SYMBOLS_PATTERN = "[A-Za-z0-9!#$%&'()*+,./:;<=>?@[\]^_`{|}~—\"\-]+"
+_LATIN_SYMBOLS_RE = re.compile(_LATIN_SYMBOLS_PATTERN)
+
+# Compiled once at import, in the order they are applied by split_into_sentences
+_PREFIXES_RE = re.compile(_PREFIXES)
+_WEBSITES_RE = re.compile(_WEBSITES)
+_DECIMAL_RE = re.compile(_DIGITS + "[.]" + _DIGITS)
+_MULTIPLE_DOTS_RE = re.compile(_MULTIPLE_DOTS)
+_SINGLE_LETTER_RE = re.compile(r"\s" + _ALPHABETS + "[.] ")
+_ACRONYM_STARTER_RE = re.compile(_ACRONYMS + " " + _STARTERS)
+_THREE_LETTER_ABBR_RE = re.compile(_ALPHABETS + "[.]" + _ALPHABETS + "[.]" + _ALPHABETS + "[.]")
+_TWO_LETTER_ABBR_RE = re.compile(_ALPHABETS + "[.]" + _ALPHABETS + "[.]")
+_SUFFIX_STARTER_RE = re.compile(" " + _SUFFIXES + "[.] " + _STARTERS)
+_SUFFIX_RE = re.compile(" " + _SUFFIXES + "[.]")
+_LETTER_DOT_RE = re.compile(" " + _ALPHABETS + "[.]")
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sentence_tokenizer():
+    """Get NLTK sentence tokenizer, loaded once and shared by all instances."""
+    return nltk.data.load("nltk:tokenizers/punkt/russian.pickle")
+
+
+@functools.lru_cache(maxsize=1024)
+def _count_sentences(text: str) -> int:
+    """Count Punkt sentences in text, cached across calls."""
+    return len(_get_sentence_tokenizer().tokenize(text))
+
+
+@functools.lru_cache(maxsize=1024)
+def _count_words(text: str) -> int:
+    """Count words in text, cached across calls."""
+    return len(_WORD_RE.findall(text))
+
+
+@functools.lru_cache(maxsize=65536)
+def _normal_form(token: str) -> str:
+    """Get the first pymorphy2 normal form of a token, cached across calls."""
+    return morph.normal_forms(token)[0]
+
+
+@functools.lru_cache(maxsize=4096)
+def _lemmatize(text: str) -> str:
+    """Lemmatize text token by token, cached across calls."""
+    text = _LATIN_SYMBOLS_RE.sub(' ', text)
+    tokens = []
+    for token in text.split():
+        token = token.strip()
+        token = _normal_form(token)
+        tokens.append(token)
+    return ' '.join(tokens)
 
 
 class RussianProcessor(BaseLanguageProcessor):
     """Russian language processor implementation."""
     
-    @functools.lru_cache(maxsize=None)
-    def _get_sentence_tokenizer(self):
-        """Get NLTK sentence tokenizer, with caching."""
-        return nltk.data.load("nltk:tokenizers/punkt/russian.pickle")
-    
     def count_sentences(self, text: str) -> int:
         """Count the number of sentences in text.
         
@@ -49,9 +95,7 @@ class RussianProcessor(BaseLanguageProcessor):
         Returns:
             Number of sentences.
         """
-        tokenizer = self._get_sentence_tokenizer()
-        sentences = tokenizer.tokenize(text)
-        return len(sentences)
+        return _count_sentences(text)
     
     def count_words(self, text: str) -> int:
         """Count the number of words in text.
@@ -62,9 +106,7 @@ class RussianProcessor(BaseLanguageProcessor):
         Returns:
             Number of words.
         """
-        tokenizer = RegexpTokenizer(r"\w+")
-        tokens = tokenizer.tokenize(text)
-        return len(tokens)
+        return _count_words(text)
     
     def split_into_sentences(self, text: str) -> List[str]:
         """Split text into sentences.
@@ -77,28 +119,24 @@ class RussianProcessor(BaseLanguageProcessor):
         """
         text = " " + text + "  "
         text = text.replace("\n", " ")
-        text = re.sub(_PREFIXES, "\\1<prd>", text)
-        text = re.sub(_WEBSITES, "<prd>\\1", text)
-        text = re.sub(_DIGITS + "[.]" + _DIGITS, "\\1<prd>\\2", text)
-        text = re.sub(
-            _MULTIPLE_DOTS,
+        text = _PREFIXES_RE.sub("\\1<prd>", text)
+        text = _WEBSITES_RE.sub("<prd>\\1", text)
+        text = _DECIMAL_RE.sub("\\1<prd>\\2", text)
+        text = _MULTIPLE_DOTS_RE.sub(
             lambda match: "<prd>" * len(match.group(0)) + "<stop>",
             text,
         )
-        if "к.т.н" in text.lower() or "д.т.н" in text.lower():
+        lowered = text.lower()
+        if "к.т.н" in lowered or "д.т.н" in lowered:
             text = text.replace("к.т.н.", "к<prd>т<prd>н<prd>")
             text = text.replace("д.т.н.", "д<prd>т<prd>н<prd>")
-        text = re.sub(r"\s" + _ALPHABETS + "[.] ", " \\1<prd> ", text)
-        text = re.sub(_ACRONYMS + " " + _STARTERS, "\\1<stop> \\2", text)
-        text = re.sub(
-            _ALPHABETS + "[.]" + _ALPHABETS + "[.]" + _ALPHABETS + "[.]",
-            "\\1<prd>\\2<prd>\\3<prd>",
-            text,
-        )
-        text = re.sub(_ALPHABETS + "[.]" + _ALPHABETS + "[.]", "\\1<prd>\\2<prd>", text)
-        text = re.sub(" " + _SUFFIXES + "[.] " + _STARTERS, " \\1<stop> \\2", text)
-        text = re.sub(" " + _SUFFIXES + "[.]", " \\1<prd>", text)
-        text = re.sub(" " + _ALPHABETS + "[.]", " \\1<prd>", text)
+        text = _SINGLE_LETTER_RE.sub(" \\1<prd> ", text)
+        text = _ACRONYM_STARTER_RE.sub("\\1<stop> \\2", text)
+        text = _THREE_LETTER_ABBR_RE.sub("\\1<prd>\\2<prd>\\3<prd>", text)
+        text = _TWO_LETTER_ABBR_RE.sub("\\1<prd>\\2<prd>", text)
+        text = _SUFFIX_STARTER_RE.sub(" \\1<stop> \\2", text)
+        text = _SUFFIX_RE.sub(" \\1<prd>", text)
+        text = _LETTER_DOT_RE.sub(" \\1<prd>", text)
         if "\"" in text:
             text = text.replace("."", "".")
         if '"' in text:
@@ -126,13 +164,7 @@ class RussianProcessor(BaseLanguageProcessor):
         Returns:
             Lemmatized text.
         """
-        text = re.sub(_LATIN_SYMBOLS_PATTERN, ' ', text)
-        tokens = []
-        for token in text.split():
-            token = token.strip()
-            token = morph.normal_forms(token)[0]
-            tokens.append(token)
-        return ' '.join(tokens)
+        return _lemmatize(text)
         
     def word_tokenize(self, text: str) -> List[str]:
         """Tokenize text into words using Russian-specific rules.
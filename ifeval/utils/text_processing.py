@@ -1,5 +1,6 @@
 """Language-agnostic text processing utilities."""
 
+import functools
 import re
 from typing import List
 from langdetect import detector_factory
@@ -109,5 +110,8 @@ def language_is_supported(lang: str):
 # To avoid further refactoring in the future, I decided to make
 # a dedicated function for language detection.
 # It will allow to seamlessly change backends if needed.
+# Results are memoized since the same response is checked several times
+# (strict and loose passes, multiple language instructions).
+@functools.lru_cache(maxsize=8192)
 def detect_language(text):
     return detect(text)
\ No newline at end of file